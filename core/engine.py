@@ -39,6 +39,7 @@ class Engine:
         self.chaos = ChaosInjector(enabled=False, fault_rate=0.0)
 
         self.running = threading.Event()
+        self.stopped = threading.Event()
         self.attack_name = f"SIMULATION-{int(time.time())}"
         self.attack_profile = "HTTP"
         self.target_profile = target_profile
@@ -288,25 +289,31 @@ class Engine:
         """
         Execute the configured simulation.
         """
+        self.stopped.clear()
         self.running.set()
         self.scheduler.start()
         max_ticks = max(1, int(self.duration / self.tick_interval))
 
-        while self.running.is_set():
-            payload = self.scheduler.next_tick()
-            if payload is None:
-                break
-            if payload["tick"] >= max_ticks:
-                break
-            self.tick(planned_rate=payload["rate"], scheduler_tick=payload["tick"])
-
-        self.scheduler.stop()
-        self.running.clear()
-        self.metrics.finalize()
+        try:
+            while self.running.is_set():
+                payload = self.scheduler.next_tick()
+                if payload is None:
+                    break
+                if payload["tick"] >= max_ticks:
+                    break
+                self.tick(planned_rate=payload["rate"], scheduler_tick=payload["tick"])
+
+            self.metrics.finalize()
+        finally:
+            # Waiters (the live dashboard) must be released even if a tick raises.
+            self.scheduler.stop()
+            self.running.clear()
+            self.stopped.set()
 
     def stop(self):
         self.running.clear()
         self.scheduler.stop()
+        self.stopped.set()
 
     def export_metrics(self) -> Dict:
         return self.metrics.export()
@@ -5,6 +5,7 @@ Defensive load and failure simulation framework.
 """
 
 import json
+import multiprocessing
 import os
 import sys
 import threading
@@ -37,7 +38,7 @@ from utils.reporting import (
     find_metric_files,
     format_compare_text,
     format_debrief_text,
-    load_metrics_payload,
+    load_and_summarize,
     resolve_metrics_file,
     score_summary,
     summarize_payload,
@@ -115,13 +116,19 @@ def _engine_kwargs_from_args(args):
     }
 
 
-def _parse_csv_values(raw: str, cast=float, low=None, high=None):
+def _parse_csv_values(raw, cast=float, low=None, high=None):
     values = []
-    for chunk in str(raw or "").split(","):
-        token = chunk.strip()
-        if not token:
-            continue
-        value = cast(token)
+    # The interactive sweep menu hands over already-parsed tuples.
+    chunks = raw if isinstance(raw, (list, tuple)) else str(raw or "").split(",")
+    for chunk in chunks:
+        if isinstance(chunk, (int, float)):
+            # Already parsed by the menu: only clamp.
+            value = chunk
+        else:
+            token = str(chunk).strip()
+            if not token:
+                continue
+            value = cast(token)
         if low is not None and value < low:
             value = low
         if high is not None and value > high:
@@ -462,14 +469,21 @@ def report_command(args):
     show_banner()
 
     input_dir = getattr(args, "input_dir", None) or getattr(args, "output_dir", get_default_output_dir())
-    summary = analyze_directory(input_dir)
-    if not summary:
+    if getattr(args, "debrief", False):
+        # Debriefs need the raw ticks too: parse each file once for both.
+        root = Path(input_dir)
+        found = find_metric_files(root) if root.exists() else []
+        results = (pair for pair in map(load_and_summarize, found) if pair[1])
+    else:
+        found = analyze_directory(input_dir)
+        results = ((None, item) for item in found)
+    if not found:
         print("[!] No metrics.json files found")
         return
 
     print("\n[*] Report Summary")
     print("=" * 80)
-    for item in summary:
+    for payload, item in results:
         mode = item.get("mode", "engine")
         print(f"File           : {item['file']}")
         print(f"Mode           : {mode}")
@@ -487,11 +501,9 @@ def report_command(args):
             print(f"Peak Queue     : {item['peak_queue_depth']}")
             print(f"Avg Error Rate : {item['avg_error_rate']}")
         print("-" * 80)
-        if getattr(args, "debrief", False):
-            payload = load_metrics_payload(item["file"])
-            if payload:
-                print(format_debrief_text(build_debrief(payload, item, label=item["file"])))
-                print("-" * 80)
+        if payload:
+            print(format_debrief_text(build_debrief(payload, item, label=item["file"])))
+            print("-" * 80)
 
 
 def compare_command(args):
@@ -512,14 +524,12 @@ def compare_command(args):
         print(f"[!] Candidate metrics file not found: {candidate_input}")
         return
 
-    baseline_payload = load_metrics_payload(str(baseline_file))
-    candidate_payload = load_metrics_payload(str(candidate_file))
+    baseline_payload, baseline_summary = load_and_summarize(baseline_file)
+    candidate_payload, candidate_summary = load_and_summarize(candidate_file)
     if not baseline_payload or not candidate_payload:
         print("[!] Failed to load metrics payload(s).")
         return
 
-    baseline_summary = summarize_payload(baseline_payload, file_label=str(baseline_file))
-    candidate_summary = summarize_payload(candidate_payload, file_label=str(candidate_file))
     comp = compare_summaries(baseline_summary, candidate_summary)
 
     if getattr(args, "json", False):
@@ -542,12 +552,11 @@ def debrief_command(args):
         print(f"[!] Could not find metrics.json from: {input_path}")
         return
 
-    payload = load_metrics_payload(str(metrics_file))
+    payload, summary = load_and_summarize(metrics_file)
     if not payload:
         print("[!] Failed to load metrics payload.")
         return
 
-    summary = summarize_payload(payload, file_label=str(metrics_file))
     debrief = build_debrief(payload, summary, label=str(metrics_file))
     if getattr(args, "json", False):
         print(json.dumps(debrief, indent=2))
@@ -734,6 +743,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Report analysis may use worker processes; needed for frozen Windows builds.
+    multiprocessing.freeze_support()
     try:
         main()
     except KeyboardInterrupt:
@@ -236,3 +236,191 @@ def test_web_dashboard_stop_terminates_server_thread():
     assert dashboard.is_running is False
     if dashboard.server_thread is not None:
         assert dashboard.server_thread.is_alive() is False
+
+
+def test_engine_stop_sets_stopped_event():
+    from core.engine import Engine
+
+    engine = Engine()
+    assert engine.stopped.is_set() is False
+    engine.stop()
+    assert engine.stopped.wait(timeout=0.1) is True
+
+
+def test_engine_run_sets_stopped_event_when_tick_raises():
+    from core.engine import Engine
+
+    engine = Engine()
+    engine.duration = 5
+    engine.tick_interval = 0.01
+
+    def broken_tick(**_kwargs):
+        raise RuntimeError("tick failed")
+
+    engine.tick = broken_tick
+    with pytest.raises(RuntimeError):
+        engine.run()
+    assert engine.stopped.is_set() is True
+    assert engine.running.is_set() is False
+
+
+def test_help_sections_have_prerendered_text():
+    from ui.help_menu import HELP_SECTIONS, RENDERED_TEXT
+
+    keys = {item["value"] for item in HELP_SECTIONS if item["value"] != "back"}
+    assert keys == set(RENDERED_TEXT)
+    assert all(text.endswith("\n") for text in RENDERED_TEXT.values())
+
+
+def test_dashboard_rolling_series_keeps_latest_window():
+    from ui.dashboard import RollingSeries
+
+    series = RollingSeries(3)
+    assert series.last() == 0.0
+    for value in range(5):
+        series.append(value)
+    assert list(series.values()) == [2.0, 3.0, 4.0]
+    assert series.last() == 4.0
+    assert series.max() == 4.0
+    assert len(series) == 3
+
+
+def test_dashboard_frame_template_renders_all_fields():
+    from ui.dashboard import FRAME_SECTIONS, LiveDashboard
+
+    dashboard = LiveDashboard(None, show_header_banner=True)
+    placeholders = sum(len(rows) for _, rows in FRAME_SECTIONS)
+    values = [1.0] * placeholders
+    values[1:4] = [b"4", b"small-web", b"HTTP"]
+    text = dashboard._template % tuple(values)
+    assert b"Live Simulation Dashboard" in text
+    assert b"Attack Profile      : HTTP" in text
+    assert b"Average Error Rate  : 1.00%" in text
+
+
+def test_write_frame_emits_lines_in_one_block(capsys):
+    from ui.arrow_prompt import write_frame
+
+    write_frame(["alpha", "beta"])
+    assert capsys.readouterr().out == "alpha\nbeta\n"
+
+
+def test_menu_state_defaults_are_independent_copies():
+    from ui.menu import MenuState
+
+    first = MenuState()
+    second = MenuState()
+    first.config["threads"] = 1
+    first.target_behavior["queue_limit"] = 1
+    assert second.config["threads"] == 50
+    assert second.target_behavior["queue_limit"] == 500
+
+
+def test_report_highlights_single_pass_aggregates():
+    from utils.html_report import _extract_highlights
+
+    raw = [
+        {"requests_per_second": 10, "latency_ms": 5, "error_rate": 0.1, "generated_events": 3, "degraded": True},
+        {"requests_per_second": 30, "latency_ms": 15, "error_rate": 0.3, "generated_events": 2, "crashed": True},
+        {"requests_per_second": 20, "latency_ms": 10, "error_rate": 0.2, "dropped_events": 4, "completed": 9},
+    ]
+    highlights = _extract_highlights({"raw": raw})
+    assert highlights["mode"] == "engine"
+    assert highlights["peak_rps"] == 30.0
+    assert highlights["avg_latency_ms"] == 10.0
+    assert highlights["generated_events_total"] == 5
+    assert highlights["dropped_events_total"] == 4
+    assert highlights["completed_total"] == 9
+    assert (highlights["state_healthy"], highlights["state_degraded"], highlights["state_crashed"]) == (1, 1, 1)
+
+
+def test_report_downsampling_keeps_spikes_and_last_point():
+    from utils.html_report import MAX_CHART_POINTS, _downsample_xy
+
+    ys = [1.0] * 5000
+    ys[2501] = 50.0
+    xs = [float(i) for i in range(len(ys))]
+    out_xs, out_ys = _downsample_xy(xs, ys)
+    assert len(out_ys) <= MAX_CHART_POINTS + 1
+    assert 50.0 in out_ys
+    assert out_xs[-1] == xs[-1]
+
+
+def test_report_downsampling_keeps_time_axis_even_with_nan():
+    from utils.html_report import _downsample_xy
+
+    ys = [1.0] * 500 + [float(i % 7) for i in range(500)]
+    ys[700] = float("nan")
+    xs = [float(i) for i in range(len(ys))]
+    out_xs, _ = _downsample_xy(xs, ys)
+    flat = sum(1 for x in out_xs if x < 500)
+    assert abs(flat - (len(out_xs) - flat)) <= 4
+
+
+def test_analyze_metrics_file_reuses_summary_until_file_changes(tmp_path):
+    import json
+    import os
+
+    from utils.reporting import analyze_metrics_file, clear_analysis_cache
+
+    clear_analysis_cache()
+    path = tmp_path / "metrics.json"
+    path.write_text(json.dumps({"raw": [{"requests_per_second": 5, "error_rate": 0.1}]}), encoding="utf-8")
+    first = analyze_metrics_file(path)
+    first["peak_rps"] = -1
+    assert analyze_metrics_file(path)["peak_rps"] == 5
+
+    path.write_text(json.dumps({"raw": [{"requests_per_second": 50, "error_rate": 0.1}]}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert analyze_metrics_file(path)["peak_rps"] == 50
+
+
+@pytest.mark.parametrize("content", ["null", "[]"])
+def test_load_and_summarize_rejects_non_object_payload(tmp_path, content):
+    from utils.reporting import load_and_summarize
+
+    metrics_file = tmp_path / "metrics.json"
+    metrics_file.write_text(content, encoding="utf-8")
+    assert load_and_summarize(metrics_file) == ({}, {})
+
+
+def test_select_single_redraws_header_with_each_frame(monkeypatch, capsys):
+    from ui import arrow_prompt
+
+    keys = iter(["DOWN", "DOWN", "ENTER"])
+    monkeypatch.setattr(arrow_prompt, "supports_arrow_ui", lambda: True)
+    monkeypatch.setattr(arrow_prompt, "supports_color", lambda: True)
+    monkeypatch.setattr(arrow_prompt, "read_key", lambda: next(keys))
+    options = [{"label": "One", "value": "one"}, {"label": "Two", "value": "two"}]
+
+    choice = arrow_prompt.select_single("Pick", options, header="BANNER\nLINE")
+    frames = capsys.readouterr().out.split(arrow_prompt.CLEAR_SEQUENCE)[1:]
+    assert choice == "one"
+    assert len(frames) == 3
+    assert all(frame.startswith("BANNER\nLINE\n") for frame in frames)
+
+
+def test_summarize_payload_tolerates_null_tick_values():
+    payload = {"raw": [{"requests_per_second": None, "latency_ms": 3.0, "queue_depth": None, "error_rate": None}]}
+    summary = summarize_payload(payload)
+    assert summary["peak_rps"] == 0
+    assert summary["peak_latency_ms"] == 3.0
+    assert summary["avg_error_rate"] == 0
+
+
+def test_close_logger_flushes_run_log(tmp_path, monkeypatch):
+    import core.config as cfg
+    from utils import logger as run_logger
+
+    monkeypatch.setattr(cfg, "BASE_OUTPUT_DIR", str(tmp_path))
+    log = run_logger.get_logger("close-test")
+    log.info("first record")
+    run_logger.close_logger("close-test")
+
+    assert "first record" in (tmp_path / "close-test" / "run.log").read_text(encoding="utf-8")
+    assert "close-test" not in run_logger._LISTENERS
+
+    restarted = run_logger.get_logger("close-test")
+    assert len(restarted.handlers) == 1
+    run_logger.close_logger("close-test")
@@ -6,15 +6,84 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from ui.theme import colorize
+from ui.theme import colorize, supports_color
+
+
+CLEAR_SEQUENCE = "\033[2J\033[H"
+_ANSI_READY: Optional[bool] = None
+
+
+def _enable_ansi() -> bool:
+    """
+    Make sure the console understands ANSI escapes. Probed once per process.
+    Windows consoles need virtual terminal processing switched on explicitly.
+    """
+    global _ANSI_READY
+    if _ANSI_READY is not None:
+        return _ANSI_READY
+
+    if os.name != "nt":
+        _ANSI_READY = True
+        return _ANSI_READY
+
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            _ANSI_READY = False
+        else:
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            _ANSI_READY = bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, ImportError, OSError):
+        _ANSI_READY = False
+    return _ANSI_READY
 
 
 def clear_screen():
+    if supports_color() and _enable_ansi():
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
+        return
     os.system("cls" if os.name == "nt" else "clear")
 
 
+def write_frame(lines: List[str], clear: bool = False):
+    """
+    Emit a whole screen of lines with a single write and flush.
+    With clear=True the clear-screen escape is folded into the same write.
+    """
+    prefix = ""
+    if clear:
+        if supports_color() and _enable_ansi():
+            prefix = CLEAR_SEQUENCE
+        else:
+            clear_screen()
+    text = prefix + "\n".join(lines) + "\n"
+    encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+    write_bytes(text.encode(encoding, "replace"), encoding)
+
+
+def write_bytes(data: bytes, encoding: str = "utf-8"):
+    """
+    Emit an already-encoded frame with a single write and flush.
+    """
+    # Hand the frame straight to the binary buffer so the whole
+    # screen is one write instead of a trip through the text layer.
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        sys.stdout.write(data.decode(encoding, "replace"))
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()
+    stream.write(data)
+    stream.flush()
+
+
 def supports_arrow_ui() -> bool:
     return bool(sys.stdin.isatty() and sys.stdout.isatty())
 
@@ -99,35 +168,38 @@ def read_key() -> str:
     return _read_key_unix()
 
 
-def select_single(title: str, options: List[Dict[str, str]], default_index: int = 0) -> str:
+def select_single(
+    title: str,
+    options: List[Dict[str, str]],
+    default_index: int = 0,
+    header: Optional[str] = None,
+) -> str:
     """
     options item: {"label": str, "value": str, "hint": str}
+    header: optional text (e.g. the banner) drawn above the menu in the same frame.
     """
+    head = [header] if header else []
     if not supports_arrow_ui():
-        for idx, item in enumerate(options, start=1):
-            print(colorize(f"[{idx}] {item['label']}", "info"))
+        write_frame(
+            head + [colorize(f"[{idx}] {item['label']}", "info") for idx, item in enumerate(options, start=1)],
+            clear=bool(head),
+        )
         while True:
             raw = input(colorize("Select option > ", "prompt")).strip()
-            try:
-                val = int(raw)
-                if 1 <= val <= len(options):
-                    return options[val - 1]["value"]
-            except ValueError:
-                pass
+            if raw.isdecimal() and 1 <= int(raw) <= len(options):
+                return options[int(raw) - 1]["value"]
             print(colorize("Invalid selection.", "error"))
 
     idx = max(0, min(default_index, len(options) - 1))
     while True:
-        clear_screen()
-        print(colorize(title, "primary"))
-        print(colorize("Use Up/Down + Enter", "muted"))
-        print("")
-
+        lines = head + [colorize(title, "primary"), colorize("Use Up/Down + Enter", "muted"), ""]
         for row, item in enumerate(options):
             cursor = ">" if row == idx else " "
-            print(colorize(f"{cursor} {item['label']}", "info"))
+            lines.append(colorize(f"{cursor} {item['label']}", "info"))
             if row == idx and item.get("hint"):
-                print(colorize(f"    {item['hint']}", "muted"))
+                lines.append(colorize(f"    {item['hint']}", "muted"))
+        # Header and menu are redrawn together so a scrolled screen stays intact.
+        write_frame(lines, clear=True)
 
         key = read_key()
         if key == "UP":
@@ -142,7 +214,7 @@ def select_single(title: str, options: List[Dict[str, str]], default_index: int
 
 def select_multiple(
     title: str,
-    options: List[Dict[str, str]],
+    options: Sequence[Dict[str, str]],
     initial_selected: Optional[List[str]] = None,
 ) -> List[str]:
     """
@@ -152,9 +224,13 @@ def select_multiple(
     """
     selected = set(initial_selected or [])
     if not supports_arrow_ui():
-        print(colorize(title, "primary"))
-        print(colorize("Comma separate names or type 'none':", "muted"))
-        print(colorize(", ".join(item["value"] for item in options), "info"))
+        write_frame(
+            [
+                colorize(title, "primary"),
+                colorize("Comma separate names or type 'none':", "muted"),
+                colorize(", ".join(item["value"] for item in options), "info"),
+            ]
+        )
         raw = input(colorize("Selection > ", "prompt")).strip().lower()
         if raw in ("", "none", "no"):
             return []
@@ -165,16 +241,18 @@ def select_multiple(
     idx = 0
     valid_values = [item["value"] for item in options]
     while True:
-        clear_screen()
-        print(colorize(title, "primary"))
-        print(colorize("Up/Down move, Space toggle, A all, N none, Enter confirm", "muted"))
-        print("")
+        lines = [
+            colorize(title, "primary"),
+            colorize("Up/Down move, Space toggle, A all, N none, Enter confirm", "muted"),
+            "",
+        ]
         for row, item in enumerate(options):
             cursor = ">" if row == idx else " "
             check = "[x]" if item["value"] in selected else "[ ]"
-            print(colorize(f"{cursor} {check} {item['label']} ({item['value']})", "info"))
+            lines.append(colorize(f"{cursor} {check} {item['label']} ({item['value']})", "info"))
             if row == idx and item.get("hint"):
-                print(colorize(f"    {item['hint']}", "muted"))
+                lines.append(colorize(f"    {item['hint']}", "muted"))
+        write_frame(lines, clear=True)
 
         key = read_key()
         if key == "UP":
@@ -223,27 +301,36 @@ def edit_numeric_config(
                     pass
         return updated
 
+    # Label padding, value format and bounds are fixed per field;
+    # build them once instead of on every keypress redraw.
+    rows = [
+        (
+            field["key"],
+            f"{field['label']:<18}",
+            f"{{:.{int(field['precision'])}f}}" if field.get("precision") is not None else None,
+            f"[{field['min']}..{field['max']}]",
+            colorize(f"    {field['hint']}", "muted") if field.get("hint") else "",
+        )
+        for field in schema
+    ]
+    header = [
+        colorize(title, "primary"),
+        colorize("Up/Down select field. Left/Right adjust. Enter saves.", "muted"),
+        "",
+    ]
+
     idx = 0
     edited = dict(values)
     while True:
-        clear_screen()
-        print(colorize(title, "primary"))
-        print(colorize("Up/Down select field. Left/Right adjust. Enter saves.", "muted"))
-        print("")
-
-        for row, field in enumerate(schema):
-            key = field["key"]
-            low = field["min"]
-            high = field["max"]
+        lines = list(header)
+        for row, (key, label, value_fmt, bounds, hint) in enumerate(rows):
             marker = ">" if row == idx else " "
             value = edited.get(key)
-            if field.get("precision") is not None:
-                shown = f"{float(value):.{int(field['precision'])}f}"
-            else:
-                shown = f"{int(value)}"
-            print(colorize(f"{marker} {field['label']:<18} {shown:<8} [{low}..{high}]", "info"))
-            if row == idx and field.get("hint"):
-                print(colorize(f"    {field['hint']}", "muted"))
+            shown = value_fmt.format(float(value)) if value_fmt is not None else f"{int(value)}"
+            lines.append(colorize(f"{marker} {label} {shown:<8} {bounds}", "info"))
+            if row == idx and hint:
+                lines.append(hint)
+        write_frame(lines, clear=True)
 
         key_name = read_key()
         if key_name == "UP":
@@ -3,6 +3,8 @@ NetLoader-X Banner Display
 Uses metadata from core.metadata for dynamic content
 """
 
+from functools import lru_cache
+
 from ui.theme import ANSIColor
 from core.metadata import (
     PROJECT_NAME,
@@ -14,8 +16,9 @@ from core.metadata import (
 )
 
 
-def show_banner():
-    """Display the NetLoader-X banner with metadata from core.metadata"""
+@lru_cache(maxsize=1)
+def render_banner() -> str:
+    """Return the NetLoader-X banner text with metadata from core.metadata (built once)"""
     # Using ANSI color codes with f-strings for simple coloring
     # Using raw string with escaping to handle backslashes in ASCII art
     banner = f"""{ANSIColor.RESET}
@@ -32,4 +35,9 @@ def show_banner():
 {ANSIColor.GRAY}Contact : {AUTHOR_EMAIL}{ANSIColor.RESET}
 {ANSIColor.GREEN}Mode    : {SAFETY_MODE}{ANSIColor.RESET}
 """
-    print(banner)
+    return banner
+
+
+def show_banner():
+    """Display the NetLoader-X banner with metadata from core.metadata"""
+    print(render_banner())
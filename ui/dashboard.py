@@ -13,18 +13,102 @@ Contact : voltsparx@gmail.com
 --------------------------------------------------
 """
 
+import os
+import sys
 import time
 import threading
-from collections import deque
+from array import array
 from statistics import mean, stdev
 
+from ui.arrow_prompt import write_bytes
 from ui.theme import colorize
-from ui.banner import show_banner
+from ui.banner import render_banner
 
 
 # Dashboard configuration
 REFRESH_INTERVAL = 0.5
 ROLLING_WINDOW = 60
+CLEAR_SEQUENCE = "\033[2J\033[H"
+CLEAR_BYTES = CLEAR_SEQUENCE.encode("ascii")
+
+# Fixed dashboard layout: (section title, value rows).
+# Rows carry printf-style placeholders filled in LiveDashboard._render.
+FRAME_SECTIONS = (
+    ("Overview", (
+        "Simulation Time     : %.1f seconds",
+        "Virtual Clients     : %b",
+        "Profile             : %b",
+        "Attack Profile      : %b",
+    )),
+    ("Request Rate", (
+        "Current RPS         : %.1f",
+        "Average RPS         : %.1f",
+        "Peak RPS            : %.1f",
+    )),
+    ("Latency (ms)", (
+        "Average Latency     : %.1f ms",
+        "Latency Jitter      : %.1f ms",
+    )),
+    ("Queue Depth", (
+        "Current Queue Depth : %.0f",
+        "Max Queue Observed  : %.0f",
+    )),
+    ("Error Rate", (
+        "Current Error Rate  : %.2f%%",
+        "Average Error Rate  : %.2f%%",
+    )),
+)
+
+
+def _static(text: str) -> str:
+    """
+    Escape literal percent signs so static text survives %-formatting.
+    """
+    return text.replace("%", "%%")
+
+
+# ==================================================
+# ROLLING HISTORY
+# ==================================================
+
+class RollingSeries:
+    """
+    Fixed-size ring buffer of floats backed by a
+    contiguous array('d') instead of boxed deque items.
+    """
+
+    __slots__ = ("_buf", "_size", "_head", "_count")
+
+    def __init__(self, size: int = ROLLING_WINDOW):
+        self._size = max(1, int(size))
+        self._buf = array("d", bytes(8 * self._size))
+        self._head = 0
+        self._count = 0
+
+    def append(self, value):
+        self._buf[self._head] = float(value)
+        self._head = (self._head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def last(self, default: float = 0.0) -> float:
+        if not self._count:
+            return default
+        return self._buf[self._head - 1]
+
+    def values(self):
+        """
+        Return the window contents, oldest first.
+        """
+        if self._count < self._size:
+            return self._buf[:self._count]
+        return self._buf[self._head:] + self._buf[:self._head]
+
+    def max(self, default: float = 0.0) -> float:
+        return max(self._buf[:self._count]) if self._count else default
+
+    def __len__(self):
+        return self._count
 
 
 # ==================================================
@@ -40,12 +124,14 @@ class LiveDashboard:
     def __init__(self, metrics_engine, show_header_banner: bool = False):
         self.metrics = metrics_engine
         self.show_header_banner = bool(show_header_banner)
+        self._encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+        self._template = self._build_template().encode(self._encoding, "replace")
         self.running = threading.Event()
         self.history = {
-            "rps": deque(maxlen=ROLLING_WINDOW),
-            "latency": deque(maxlen=ROLLING_WINDOW),
-            "errors": deque(maxlen=ROLLING_WINDOW),
-            "queue": deque(maxlen=ROLLING_WINDOW)
+            "rps": RollingSeries(ROLLING_WINDOW),
+            "latency": RollingSeries(ROLLING_WINDOW),
+            "errors": RollingSeries(ROLLING_WINDOW),
+            "queue": RollingSeries(ROLLING_WINDOW)
         }
 
     # --------------------------------------------------
@@ -85,75 +171,65 @@ class LiveDashboard:
     # --------------------------------------------------
 
     def _render(self, snap):
-        self._clear()
-        if self.show_header_banner:
-            show_banner()
-
-        print(colorize("\n[ Live Simulation Dashboard ]", "primary"))
-        print(colorize("=" * 60, "primary"))
-
-        self._render_overview(snap)
-        self._render_rates()
-        self._render_latency()
-        self._render_queue()
-        self._render_errors()
-
-        print(colorize("\n[CTRL+C] Stop simulation safely", "muted"))
+        get = snap.get
+        clients = get("active_clients")
+        if clients is None:
+            clients = get("active_workers", 0)
+
+        rps = self.history["rps"]
+        latency = self.history["latency"].values()
+        queue = self.history["queue"]
+        errors = self.history["errors"]
+
+        encoding = self._encoding
+        values = (
+            get("uptime", 0),
+            str(clients).encode(encoding, "replace"),
+            str(get("profile_name", "N/A")).encode(encoding, "replace"),
+            str(get("attack_profile", "N/A")).encode(encoding, "replace"),
+            rps.last(),
+            self._safe_mean(rps.values()),
+            rps.max(),
+            self._safe_mean(latency),
+            self._safe_stdev(latency),
+            queue.last(),
+            queue.max(),
+            errors.last() * 100,
+            self._safe_mean(errors.values()) * 100,
+        )
+
+        # Format straight to bytes and hand the frame to the binary stream
+        # in one write, skipping the text layer.
+        frame = self._template % values
+        if os.name == "nt":
+            self._clear()
+        else:
+            frame = CLEAR_BYTES + frame
+        write_bytes(frame, self._encoding)
 
     # --------------------------------------------------
-    # SECTIONS
+    # FRAME TEMPLATE
     # --------------------------------------------------
 
-    def _render_overview(self, snap):
-        print(colorize("\nOverview", "section"))
-        print(colorize("-" * 60, "section"))
-
-        print(f"Simulation Time     : {snap.get('uptime', 0):.1f} seconds")
-        print(f"Virtual Clients     : {snap.get('active_clients', snap.get('active_workers', 0))}")
-        print(f"Profile             : {snap.get('profile_name', 'N/A')}")
-        print(f"Attack Profile      : {snap.get('attack_profile', 'N/A')}")
-
-    def _render_rates(self):
-        print(colorize("\nRequest Rate", "section"))
-        print(colorize("-" * 60, "section"))
-
-        avg = self._safe_mean(self.history["rps"])
-        peak = max(self.history["rps"], default=0)
-
-        print(f"Current RPS         : {self.history['rps'][-1]:.1f}" if self.history["rps"] else "Current RPS         : 0.0")
-        print(f"Average RPS         : {avg:.1f}")
-        print(f"Peak RPS            : {peak:.1f}")
-
-    def _render_latency(self):
-        print(colorize("\nLatency (ms)", "section"))
-        print(colorize("-" * 60, "section"))
-
-        avg = self._safe_mean(self.history["latency"])
-        jitter = self._safe_stdev(self.history["latency"])
-
-        print(f"Average Latency     : {avg:.1f} ms")
-        print(f"Latency Jitter      : {jitter:.1f} ms")
-
-    def _render_queue(self):
-        print(colorize("\nQueue Depth", "section"))
-        print(colorize("-" * 60, "section"))
-
-        max_q = max(self.history["queue"], default=0)
-
-        print(f"Current Queue Depth : {self.history['queue'][-1]}" if self.history["queue"] else "Current Queue Depth : 0")
-        print(f"Max Queue Observed  : {max_q}")
+    def _build_template(self) -> str:
+        """
+        Pre-colorize every static part of the frame once.
+        Only the numeric fields are filled in per refresh.
+        """
+        parts = []
+        if self.show_header_banner:
+            parts.append(_static(render_banner() + "\n"))
 
-    def _render_errors(self):
-        print(colorize("\nError Rate", "section"))
-        print(colorize("-" * 60, "section"))
+        parts.append(_static(colorize("\n[ Live Simulation Dashboard ]", "primary") + "\n"))
+        parts.append(_static(colorize("=" * 60, "primary") + "\n"))
 
-        avg = self._safe_mean(self.history["errors"])
+        for title, rows in FRAME_SECTIONS:
+            parts.append(_static(colorize(f"\n{title}", "section") + "\n"))
+            parts.append(_static(colorize("-" * 60, "section") + "\n"))
+            parts.extend(f"{row}\n" for row in rows)
 
-        if self.history["errors"]:
-            print(f"Current Error Rate  : {self.history['errors'][-1]*100:.2f}%")
-        else:
-            print("Current Error Rate  : 0.00%")
-        print(f"Average Error Rate  : {avg*100:.2f}%")
+        parts.append(_static(colorize("\n[CTRL+C] Stop simulation safely", "muted") + "\n"))
+        return "".join(parts)
 
     # --------------------------------------------------
     # SAFE STATS
@@ -173,8 +249,10 @@ class LiveDashboard:
 
     @staticmethod
     def _clear():
-        import os
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            os.system("cls")
+        else:
+            sys.stdout.write(CLEAR_SEQUENCE)
 
 
 # ==================================================
@@ -189,9 +267,14 @@ def live_dashboard(engine):
     dashboard.start()
     
     try:
-        # Keep dashboard running while engine runs
-        while engine.running.is_set():
-            time.sleep(0.5)
+        # Block until the engine signals completion instead of polling.
+        # Windows cannot interrupt an untimed wait with Ctrl+C, so wake
+        # up periodically there to stay responsive.
+        if os.name == "nt":
+            while not engine.stopped.wait(REFRESH_INTERVAL):
+                pass
+        else:
+            engine.stopped.wait()
     except KeyboardInterrupt:
         pass
     finally:
@@ -4,8 +4,8 @@ NetLoader-X :: Help & Learning Module
 
 from __future__ import annotations
 
-from ui.arrow_prompt import clear_screen, select_single
-from ui.banner import show_banner
+from ui.arrow_prompt import select_single, write_frame
+from ui.banner import render_banner
 from ui.theme import colorize
 
 
@@ -26,11 +26,7 @@ def _pause():
     input(colorize("\nPress ENTER to return...", "muted"))
 
 
-def _render_intro():
-    print(colorize("\nWhat is NetLoader-X?", "primary"))
-    print(colorize("--------------------", "primary"))
-    print(colorize(
-        """
+_INTRO_BODY = """
 NetLoader-X is an educational simulator for resilience learning.
 
 It does not send real network traffic.
@@ -38,16 +34,10 @@ It does not target external systems.
 It runs safe, bounded behavior models on localhost.
 
 Use it to study overload patterns, queue dynamics, and recovery behavior.
-""",
-        "info",
-    ))
+"""
 
 
-def _render_concepts():
-    print(colorize("\nTheory: Load vs Failure", "primary"))
-    print(colorize("-----------------------", "primary"))
-    print(colorize(
-        """
+_CONCEPTS_BODY = """
 Core concepts:
 - Throughput pressure increases queue depth.
 - Queue growth drives latency and timeout risk.
@@ -55,16 +45,10 @@ Core concepts:
 - Recovery is usually slower than degradation.
 
 The simulator lets you inspect these relationships safely.
-""",
-        "info",
-    ))
+"""
 
 
-def _render_profiles():
-    print(colorize("\nAttack Profiles (10)", "primary"))
-    print(colorize("--------------------", "primary"))
-    print(colorize(
-        """
+_PROFILES_BODY = """
 1. http      : steady request pressure
 2. burst     : repeated spikes
 3. slow      : long-held client pressure
@@ -75,31 +59,19 @@ def _render_profiles():
 8. spike     : flash crowd surge
 9. brownout  : sustained partial degradation
 10. recovery : overload then stabilization
-""",
-        "info",
-    ))
+"""
 
 
-def _render_locks():
-    print(colorize("\nSafe Configuration Locks", "primary"))
-    print(colorize("------------------------", "primary"))
-    print(colorize(
-        """
+_LOCKS_BODY = """
 Editable values are safety-clamped:
 - threads, duration, rate, jitter
 - queue limit, timeout, crash threshold, recovery rate, error floor
 
 These limits keep simulations educational and prevent unsafe local overload.
-""",
-        "info",
-    ))
+"""
 
 
-def _render_server():
-    print(colorize("\nServer Failure Model", "primary"))
-    print(colorize("--------------------", "primary"))
-    print(colorize(
-        """
+_SERVER_BODY = """
 Queue limit:
 - Higher values buffer bursts, but increase latency risk.
 
@@ -111,16 +83,10 @@ Crash threshold:
 
 Recovery rate:
 - How quickly synthetic service recovers after stress.
-""",
-        "info",
-    ))
+"""
 
 
-def _render_extensions():
-    print(colorize("\nPlugins, Filters, Nano AI", "primary"))
-    print(colorize("--------------------------", "primary"))
-    print(colorize(
-        """
+_EXTENSIONS_BODY = """
 Plugins (annotate metrics):
 - nano-coach
 - trend-lens
@@ -132,16 +98,10 @@ Filters (clean/smooth metrics):
 - queue-floor
 
 Nano AI provides rule-based hints for safer interpretation.
-""",
-        "info",
-    ))
+"""
 
 
-def _render_defense():
-    print(colorize("\nDefensive Takeaways", "primary"))
-    print(colorize("-------------------", "primary"))
-    print(colorize(
-        """
+_DEFENSE_BODY = """
 Watch these first:
 - queue depth (early warning)
 - latency trend (degradation)
@@ -149,46 +109,52 @@ Watch these first:
 - recovery slope (resilience)
 
 Run baseline + stressed scenarios and compare reports side by side.
-""",
-        "info",
-    ))
+"""
 
 
-def _render_ethics():
-    print(colorize("\nEthical Scope", "primary"))
-    print(colorize("-------------", "primary"))
-    print(colorize(
-        """
+_ETHICS_BODY = """
 This project is for defensive education.
 No external targets, no raw traffic, no attack execution.
 
 Use responsibly and lawfully.
-""",
-        "warning",
-    ))
-
-
-RENDERERS = {
-    "intro": _render_intro,
-    "concepts": _render_concepts,
-    "profiles": _render_profiles,
-    "locks": _render_locks,
-    "server": _render_server,
-    "extensions": _render_extensions,
-    "defense": _render_defense,
-    "ethics": _render_ethics,
+"""
+
+
+def _prerender(title: str, body: str, style: str = "info", rule: int = 0) -> str:
+    """
+    Build a fully colorized help section once so showing it is a single write.
+    rule: underline width when it differs from the title length.
+    """
+    return "".join(
+        [
+            colorize(f"\n{title}", "primary"),
+            "\n",
+            colorize("-" * (rule or len(title)), "primary"),
+            "\n",
+            colorize(body, style),
+            "\n",
+        ]
+    )
+
+
+RENDERED_TEXT = {
+    "intro": _prerender("What is NetLoader-X?", _INTRO_BODY),
+    "concepts": _prerender("Theory: Load vs Failure", _CONCEPTS_BODY),
+    "profiles": _prerender("Attack Profiles (10)", _PROFILES_BODY),
+    "locks": _prerender("Safe Configuration Locks", _LOCKS_BODY),
+    "server": _prerender("Server Failure Model", _SERVER_BODY),
+    "extensions": _prerender("Plugins, Filters, Nano AI", _EXTENSIONS_BODY, rule=26),
+    "defense": _prerender("Defensive Takeaways", _DEFENSE_BODY),
+    "ethics": _prerender("Ethical Scope", _ETHICS_BODY, "warning"),
 }
 
 
 def render_help():
     while True:
-        clear_screen()
-        show_banner()
-        choice = select_single("Help & Learning Menu", HELP_SECTIONS, default_index=0)
+        choice = select_single("Help & Learning Menu", HELP_SECTIONS, default_index=0, header=render_banner())
         if choice == "back":
             return
 
-        clear_screen()
-        show_banner()
-        RENDERERS[choice]()
+        # The section text already ends with its own newline.
+        write_frame([render_banner(), RENDERED_TEXT[choice][:-1]], clear=True)
         _pause()
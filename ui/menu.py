@@ -8,16 +8,13 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from core.config import USER_TUNABLE_LIMITS
-from core.nano_ai import NanoAIAdvisor
-from filters import available_filters
-from plugins import available_plugins
-from ui.arrow_prompt import clear_screen, edit_numeric_config, select_multiple, select_single
-from ui.banner import show_banner
-from ui.help_menu import render_help
-from ui.theme import colorize
+from ui.arrow_prompt import clear_screen, edit_numeric_config, select_multiple, select_single, write_frame
+from ui.banner import render_banner
+from ui.theme import colorize, style_codes
 from utils.logger import log_event
 
 
@@ -36,22 +33,30 @@ PROFILE_OPTIONS = [
 ]
 
 
-def _plugin_options() -> List[Dict[str, str]]:
+# Plugin/filter registries are fixed at import time, so the option lists are
+# built once. Call _plugin_options.cache_clear() after changing a registry.
+@lru_cache(maxsize=1)
+def _plugin_options() -> Tuple[Dict[str, str], ...]:
+    from plugins import available_plugins
+
     registry = available_plugins()
     names = sorted(registry.keys())
-    return [
+    return tuple(
         {"label": name, "value": name, "hint": registry[name].description}
         for name in names
-    ]
+    )
 
 
-def _filter_options() -> List[Dict[str, str]]:
+@lru_cache(maxsize=1)
+def _filter_options() -> Tuple[Dict[str, str], ...]:
+    from filters import available_filters
+
     registry = available_filters()
     names = sorted(registry.keys())
-    return [
+    return tuple(
         {"label": name, "value": name, "hint": registry[name].description}
         for name in names
-    ]
+    )
 
 
 def _schema_for(keys: List[str], labels: Dict[str, str], hints: Dict[str, str], precision: Dict[str, int]):
@@ -72,7 +77,69 @@ def _schema_for(keys: List[str], labels: Dict[str, str], hints: Dict[str, str],
     return schema
 
 
-@dataclass
+# Numeric editor schemas depend only on static limits, so build them once.
+_CONFIG_SCHEMA = _schema_for(
+    ["threads", "duration", "rate", "jitter"],
+    {
+        "threads": "Threads",
+        "duration": "Duration (s)",
+        "rate": "Rate",
+        "jitter": "Jitter",
+    },
+    {
+        "threads": "Virtual clients. Higher means stronger synthetic pressure.",
+        "duration": "Longer runs reveal recovery patterns.",
+        "rate": "Scheduler baseline requests per tick.",
+        "jitter": "Randomness in traffic timing.",
+    },
+    {"jitter": 2},
+)
+
+_TARGET_SCHEMA = _schema_for(
+    ["queue_limit", "timeout_ms", "crash_threshold", "recovery_rate", "error_floor"],
+    {
+        "queue_limit": "Queue Limit",
+        "timeout_ms": "Timeout (ms)",
+        "crash_threshold": "Crash Threshold",
+        "recovery_rate": "Recovery Rate",
+        "error_floor": "Error Floor",
+    },
+    {
+        "queue_limit": "Max queued requests before overflow.",
+        "timeout_ms": "Synthetic timeout boundary.",
+        "crash_threshold": "Pressure level that triggers crash mode.",
+        "recovery_rate": "How fast simulated service recovers.",
+        "error_floor": "Minimum baseline error.",
+    },
+    {
+        "crash_threshold": 2,
+        "recovery_rate": 2,
+        "error_floor": 2,
+    },
+)
+
+
+# Default templates copied into each MenuState (flat values, so copy() suffices).
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "threads": 50,
+    "duration": 120,
+    "rate": 2000,
+    "jitter": 0.10,
+}
+
+_DEFAULT_TARGET_BEHAVIOR: Dict[str, Any] = {
+    "queue_limit": 500,
+    "timeout_ms": 1200,
+    "crash_threshold": 0.95,
+    "recovery_rate": 0.04,
+    "error_floor": 0.04,
+}
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MenuState:
     attack_profile: str = "http"
     action: str = "run"
@@ -83,27 +150,19 @@ class MenuState:
     compare_candidate: str = ""
     debrief_input: str = ""
     sweep_spec: Dict[str, Any] = field(default_factory=dict)
-    config: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "threads": 50,
-            "duration": 120,
-            "rate": 2000,
-            "jitter": 0.10,
-        }
-    )
-    target_behavior: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "queue_limit": 500,
-            "timeout_ms": 1200,
-            "crash_threshold": 0.95,
-            "recovery_rate": 0.04,
-            "error_floor": 0.04,
-        }
-    )
+    config: Dict[str, Any] = field(default_factory=_DEFAULT_CONFIG.copy)
+    target_behavior: Dict[str, Any] = field(default_factory=_DEFAULT_TARGET_BEHAVIOR.copy)
     plugins: List[str] = field(default_factory=list)
     filters: List[str] = field(default_factory=list)
 
 
+def _show_screen(lines: List[str]):
+    """
+    Clear the terminal and draw the banner plus the given lines in one write.
+    """
+    write_frame([render_banner(), *lines], clear=True)
+
+
 def pause(msg: str = "Press ENTER to continue..."):
     input(colorize(msg, "muted"))
 
@@ -113,6 +172,21 @@ def _prompt_with_default(prompt: str, default: str) -> str:
     return raw or default
 
 
+def _prompt_csv(prompt: str, default: str, cast=float) -> Tuple[Any, ...]:
+    """
+    Prompt for comma-separated numbers and parse them once, re-asking on bad input.
+    """
+    while True:
+        raw = _prompt_with_default(prompt, default)
+        try:
+            values = tuple(cast(token) for token in (chunk.strip() for chunk in raw.split(",")) if token)
+        except ValueError:
+            values = ()
+        if values:
+            return values
+        print(colorize("[!] Enter comma-separated numbers, e.g. 20,50,100", "error"))
+
+
 def _to_int(raw: str, default: int) -> int:
     try:
         return int(raw)
@@ -128,21 +202,7 @@ def profile_menu(state: MenuState):
 
 
 def configuration_menu(state: MenuState):
-    labels = {
-        "threads": "Threads",
-        "duration": "Duration (s)",
-        "rate": "Rate",
-        "jitter": "Jitter",
-    }
-    hints = {
-        "threads": "Virtual clients. Higher means stronger synthetic pressure.",
-        "duration": "Longer runs reveal recovery patterns.",
-        "rate": "Scheduler baseline requests per tick.",
-        "jitter": "Randomness in traffic timing.",
-    }
-    precision = {"jitter": 2}
-    schema = _schema_for(["threads", "duration", "rate", "jitter"], labels, hints, precision)
-    state.config = edit_numeric_config("Simulation Configuration", state.config, schema)
+    state.config = edit_numeric_config("Simulation Configuration", state.config, _CONFIG_SCHEMA)
 
     toggle = select_single(
         "Nano AI Assistant",
@@ -172,43 +232,20 @@ def configuration_menu(state: MenuState):
     elif debrief_toggle == "off":
         state.auto_debrief = False
 
-    clear_screen()
-    show_banner()
+    from core.nano_ai import NanoAIAdvisor
+
     advisor = NanoAIAdvisor()
-    print(colorize("\nNano AI Configuration Tips", "primary"))
-    print(colorize("--------------------------", "primary"))
-    for tip in advisor.advise_config(state.config):
-        print(colorize(f"- {tip}", "info"))
+    lines = [
+        colorize("\nNano AI Configuration Tips", "primary"),
+        colorize("--------------------------", "primary"),
+    ]
+    lines.extend(colorize(f"- {tip}", "info") for tip in advisor.advise_config(state.config))
+    _show_screen(lines)
     pause()
 
 
 def target_menu(state: MenuState):
-    labels = {
-        "queue_limit": "Queue Limit",
-        "timeout_ms": "Timeout (ms)",
-        "crash_threshold": "Crash Threshold",
-        "recovery_rate": "Recovery Rate",
-        "error_floor": "Error Floor",
-    }
-    hints = {
-        "queue_limit": "Max queued requests before overflow.",
-        "timeout_ms": "Synthetic timeout boundary.",
-        "crash_threshold": "Pressure level that triggers crash mode.",
-        "recovery_rate": "How fast simulated service recovers.",
-        "error_floor": "Minimum baseline error.",
-    }
-    precision = {
-        "crash_threshold": 2,
-        "recovery_rate": 2,
-        "error_floor": 2,
-    }
-    schema = _schema_for(
-        ["queue_limit", "timeout_ms", "crash_threshold", "recovery_rate", "error_floor"],
-        labels,
-        hints,
-        precision,
-    )
-    state.target_behavior = edit_numeric_config("Server Failure Behavior (Safe Model)", state.target_behavior, schema)
+    state.target_behavior = edit_numeric_config("Server Failure Behavior (Safe Model)", state.target_behavior, _TARGET_SCHEMA)
 
 
 def extensions_menu(state: MenuState):
@@ -225,11 +262,13 @@ def extensions_menu(state: MenuState):
 
 
 def compare_menu(state: MenuState):
-    clear_screen()
-    show_banner()
-    print(colorize("\nCompare Reports", "primary"))
-    print(colorize("---------------", "primary"))
-    print(colorize("Provide metrics.json file path or a report directory.", "muted"))
+    _show_screen(
+        [
+            colorize("\nCompare Reports", "primary"),
+            colorize("---------------", "primary"),
+            colorize("Provide metrics.json file path or a report directory.", "muted"),
+        ]
+    )
     baseline = _prompt_with_default("Baseline path", state.compare_baseline or "outputs")
     candidate = _prompt_with_default("Candidate path", state.compare_candidate or "outputs")
     state.compare_baseline = baseline
@@ -238,27 +277,31 @@ def compare_menu(state: MenuState):
 
 
 def debrief_menu(state: MenuState):
-    clear_screen()
-    show_banner()
-    print(colorize("\nTeaching Debrief", "primary"))
-    print(colorize("----------------", "primary"))
-    print(colorize("Provide metrics.json file path or a report directory.", "muted"))
+    _show_screen(
+        [
+            colorize("\nTeaching Debrief", "primary"),
+            colorize("----------------", "primary"),
+            colorize("Provide metrics.json file path or a report directory.", "muted"),
+        ]
+    )
     state.debrief_input = _prompt_with_default("Input path", state.debrief_input or "outputs")
     state.action = "debrief"
 
 
 def sweep_menu(state: MenuState):
-    clear_screen()
-    show_banner()
-    print(colorize("\nParameter Sweep Setup", "primary"))
-    print(colorize("---------------------", "primary"))
-    print(colorize("CSV examples: 20,50,100", "muted"))
+    _show_screen(
+        [
+            colorize("\nParameter Sweep Setup", "primary"),
+            colorize("---------------------", "primary"),
+            colorize("CSV examples: 20,50,100", "muted"),
+        ]
+    )
     state.sweep_spec = {
         "profile": _prompt_with_default("Profile", state.attack_profile),
-        "threads_values": _prompt_with_default("Threads values", "20,50,100"),
-        "duration_values": _prompt_with_default("Duration values", "20,40"),
-        "rate_values": _prompt_with_default("Rate values", "1000,3000,5000"),
-        "jitter_values": _prompt_with_default("Jitter values", "0.05,0.10,0.20"),
+        "threads_values": _prompt_csv("Threads values", "20,50,100", int),
+        "duration_values": _prompt_csv("Duration values", "20,40", int),
+        "rate_values": _prompt_csv("Rate values", "1000,3000,5000", int),
+        "jitter_values": _prompt_csv("Jitter values", "0.05,0.10,0.20", float),
         "top": _to_int(_prompt_with_default("Top results", "5"), 5),
         "max_runs": _to_int(_prompt_with_default("Max runs", "36"), 36),
         "score_mode": _prompt_with_default("Score mode (balanced/throughput/stability)", "balanced"),
@@ -266,30 +309,52 @@ def sweep_menu(state: MenuState):
     state.action = "sweep"
 
 
-def _print_state_summary(state: MenuState):
-    print(colorize("\nSimulation Summary", "primary"))
-    print(colorize("------------------", "primary"))
-    print(colorize(f"Profile       : {state.attack_profile}", "info"))
-    print(colorize(f"Threads       : {state.config['threads']}", "info"))
-    print(colorize(f"Duration      : {state.config['duration']} sec", "info"))
-    print(colorize(f"Rate          : {state.config['rate']}", "info"))
-    print(colorize(f"Jitter        : {state.config['jitter']}", "info"))
-    print(colorize(f"Queue Limit   : {state.target_behavior['queue_limit']}", "info"))
-    print(colorize(f"Timeout (ms)  : {state.target_behavior['timeout_ms']}", "info"))
-    print(colorize(f"Crash Thresh  : {state.target_behavior['crash_threshold']}", "info"))
-    print(colorize(f"Recovery Rate : {state.target_behavior['recovery_rate']}", "info"))
-    print(colorize(f"Error Floor   : {state.target_behavior['error_floor']}", "info"))
-    print(colorize(f"Plugins       : {', '.join(state.plugins) if state.plugins else 'none'}", "info"))
-    print(colorize(f"Filters       : {', '.join(state.filters) if state.filters else 'none'}", "info"))
-    print(colorize(f"Nano AI       : {'enabled' if state.nano_ai else 'disabled'}", "info"))
-    print(colorize(f"Auto Debrief  : {'enabled' if state.auto_debrief else 'disabled'}", "info"))
-    print(colorize("\n[!] Localhost simulation only. No real traffic is generated.", "warning"))
+def _enabled(flag: bool) -> str:
+    return "enabled" if flag else "disabled"
+
+
+def _names(items: List[str]) -> str:
+    return ", ".join(items) if items else "none"
+
+
+_INFO_OPEN, _INFO_CLOSE = style_codes("info")
+
+# Summary rows: pre-colored label prefix + accessor for the dynamic value.
+_SUMMARY_ROWS = tuple(
+    (_INFO_OPEN + label, getter)
+    for label, getter in (
+        ("Profile       : ", lambda s: s.attack_profile),
+        ("Threads       : ", lambda s: s.config["threads"]),
+        ("Duration      : ", lambda s: f"{s.config['duration']} sec"),
+        ("Rate          : ", lambda s: s.config["rate"]),
+        ("Jitter        : ", lambda s: s.config["jitter"]),
+        ("Queue Limit   : ", lambda s: s.target_behavior["queue_limit"]),
+        ("Timeout (ms)  : ", lambda s: s.target_behavior["timeout_ms"]),
+        ("Crash Thresh  : ", lambda s: s.target_behavior["crash_threshold"]),
+        ("Recovery Rate : ", lambda s: s.target_behavior["recovery_rate"]),
+        ("Error Floor   : ", lambda s: s.target_behavior["error_floor"]),
+        ("Plugins       : ", lambda s: _names(s.plugins)),
+        ("Filters       : ", lambda s: _names(s.filters)),
+        ("Nano AI       : ", lambda s: _enabled(s.nano_ai)),
+        ("Auto Debrief  : ", lambda s: _enabled(s.auto_debrief)),
+    )
+)
+_SUMMARY_HEADER = (
+    colorize("\nSimulation Summary", "primary"),
+    colorize("------------------", "primary"),
+)
+_SUMMARY_FOOTER = colorize("\n[!] Localhost simulation only. No real traffic is generated.", "warning")
+
+
+def _state_summary_lines(state: MenuState) -> List[str]:
+    lines = list(_SUMMARY_HEADER)
+    lines.extend(f"{label}{getter(state)}{_INFO_CLOSE}" for label, getter in _SUMMARY_ROWS)
+    lines.append(_SUMMARY_FOOTER)
+    return lines
 
 
 def confirm_start(state: MenuState) -> bool:
-    clear_screen()
-    show_banner()
-    _print_state_summary(state)
+    _show_screen(_state_summary_lines(state))
     while True:
         ans = input(colorize("\nConfirm start? (yes/no) > ", "prompt")).strip().lower()
         if ans in ("yes", "y"):
@@ -302,44 +367,54 @@ def confirm_start(state: MenuState) -> bool:
         print(colorize("[!] Please type yes or no.", "error"))
 
 
+MAIN_MENU_OPTIONS = [
+    {"label": "Configure Simulation", "value": "config", "hint": "Threads, duration, jitter, rate"},
+    {"label": "Select Attack Profile", "value": "profile", "hint": "Choose one of 10 behavior profiles"},
+    {"label": "Target & Server Behavior", "value": "target", "hint": "Queue/timeout/recovery safe knobs"},
+    {"label": "Plugins & Filters", "value": "extensions", "hint": "Select none/single/multiple extensions"},
+    {"label": "Run Parameter Sweep", "value": "sweep", "hint": "Grid search and ranking"},
+    {"label": "Compare Two Reports", "value": "compare", "hint": "Causal diff between runs"},
+    {"label": "Debrief Existing Report", "value": "debrief", "hint": "Teaching summary for a run"},
+    {"label": "View Help / Theory", "value": "help", "hint": "Learning notes and profile theory"},
+    {"label": "Start Simulation", "value": "start", "hint": "Run with current state"},
+    {"label": "Exit", "value": "exit", "hint": "Quit"},
+]
+
+# Sub-menus that edit state and return to the main menu.
+_EDIT_HANDLERS = {
+    "config": configuration_menu,
+    "profile": profile_menu,
+    "target": target_menu,
+    "extensions": extensions_menu,
+}
+
+# Sub-menus that set state.action and leave the menu loop.
+_EXIT_HANDLERS = {
+    "sweep": sweep_menu,
+    "compare": compare_menu,
+    "debrief": debrief_menu,
+}
+
+
 def run_menu() -> MenuState:
     state = MenuState()
-    menu_options = [
-        {"label": "Configure Simulation", "value": "config", "hint": "Threads, duration, jitter, rate"},
-        {"label": "Select Attack Profile", "value": "profile", "hint": "Choose one of 10 behavior profiles"},
-        {"label": "Target & Server Behavior", "value": "target", "hint": "Queue/timeout/recovery safe knobs"},
-        {"label": "Plugins & Filters", "value": "extensions", "hint": "Select none/single/multiple extensions"},
-        {"label": "Run Parameter Sweep", "value": "sweep", "hint": "Grid search and ranking"},
-        {"label": "Compare Two Reports", "value": "compare", "hint": "Causal diff between runs"},
-        {"label": "Debrief Existing Report", "value": "debrief", "hint": "Teaching summary for a run"},
-        {"label": "View Help / Theory", "value": "help", "hint": "Learning notes and profile theory"},
-        {"label": "Start Simulation", "value": "start", "hint": "Run with current state"},
-        {"label": "Exit", "value": "exit", "hint": "Quit"},
-    ]
 
     while True:
-        clear_screen()
-        show_banner()
-        choice = select_single("Main Menu", menu_options, default_index=0)
-
-        if choice == "config":
-            configuration_menu(state)
-        elif choice == "profile":
-            profile_menu(state)
-        elif choice == "target":
-            target_menu(state)
-        elif choice == "extensions":
-            extensions_menu(state)
-        elif choice == "sweep":
-            sweep_menu(state)
-            return state
-        elif choice == "compare":
-            compare_menu(state)
-            return state
-        elif choice == "debrief":
-            debrief_menu(state)
+        choice = select_single("Main Menu", MAIN_MENU_OPTIONS, default_index=0, header=render_banner())
+
+        handler = _EDIT_HANDLERS.get(choice)
+        if handler is not None:
+            handler(state)
+            continue
+
+        handler = _EXIT_HANDLERS.get(choice)
+        if handler is not None:
+            handler(state)
             return state
-        elif choice == "help":
+
+        if choice == "help":
+            from ui.help_menu import render_help
+
             render_help()
         elif choice == "start":
             if confirm_start(state):
@@ -2,6 +2,9 @@
 NetLoader-X Theme Definitions
 """
 
+import os
+
+
 # Rich Theme Colors
 class Theme:
     BLUE = "bold bright_blue"
@@ -28,14 +31,32 @@ class ANSIColor:
     RESET = "\033[0m"          # Reset to default
 
 
+# NO_COLOR is read once at import; the environment does not change mid-run.
+_SUPPORTS_COLOR = not os.environ.get("NO_COLOR")
+
+
 def supports_color() -> bool:
     """
     Basic ANSI color support check.
     """
-    import os
-    if os.environ.get("NO_COLOR"):
-        return False
-    return True
+    return _SUPPORTS_COLOR
+
+
+# Plain module constants so colorize() avoids class attribute lookups per call.
+_DEFAULT_COLOR = ANSIColor.WHITE
+_RESET = ANSIColor.RESET
+
+# Style name -> ANSI prefix, resolved once instead of on every colorize call.
+STYLE_MAP = {
+    "primary": ANSIColor.BLUE,
+    "info": ANSIColor.CYAN,
+    "success": ANSIColor.GREEN,
+    "warning": ANSIColor.YELLOW,
+    "error": ANSIColor.RED,
+    "muted": ANSIColor.GRAY,
+    "section": ANSIColor.BLUE,
+    "prompt": ANSIColor.CYAN
+}
 
 
 def colorize(text: str, style: str = "info") -> str:
@@ -43,19 +64,17 @@ def colorize(text: str, style: str = "info") -> str:
     Simple text coloring utility using ANSI codes.
     Returns colored text for terminal output.
     """
-    style_map = {
-        "primary": ANSIColor.BLUE,
-        "info": ANSIColor.CYAN,
-        "success": ANSIColor.GREEN,
-        "warning": ANSIColor.YELLOW,
-        "error": ANSIColor.RED,
-        "muted": ANSIColor.GRAY,
-        "section": ANSIColor.BLUE,
-        "prompt": ANSIColor.CYAN
-    }
-    
-    if not supports_color():
+    if not _SUPPORTS_COLOR:
         return text
 
-    color = style_map.get(style, ANSIColor.WHITE)
-    return f"{color}{text}{ANSIColor.RESET}"
+    return f"{STYLE_MAP.get(style, _DEFAULT_COLOR)}{text}{_RESET}"
+
+
+def style_codes(style: str = "info"):
+    """
+    Return the (prefix, suffix) pair colorize() wraps text with,
+    so static labels can be colored once and reused.
+    """
+    if not _SUPPORTS_COLOR:
+        return "", ""
+    return STYLE_MAP.get(style, _DEFAULT_COLOR), _RESET
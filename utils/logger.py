@@ -2,13 +2,48 @@
 NetLoader-X logging helpers.
 """
 
+import atexit
 import logging
 import os
-from datetime import datetime
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 
 import core.config as cfg
 
 _VERBOSE = False
+LOG_FILE_BUFFER = 1 << 20
+_LOGGERS = {}
+_LISTENERS = {}
+# Console timestamps only change once a second; reformat lazily.
+_last_stamp_second = -1
+_last_stamp = ""
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    Run-log handler that lets a large file buffer batch its writes.
+
+    The file is opened on the first record. Records at WARNING and above are
+    flushed immediately; everything else reaches disk when the buffer fills
+    or the run's logger is closed (see close_logger).
+    """
+
+    def __init__(self, filename: str):
+        self._flush_now = False
+        super().__init__(filename, encoding="utf-8", delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER, encoding=self.encoding)
+
+    def emit(self, record):
+        self._flush_now = record.levelno >= logging.WARNING
+        super().emit(record)
+
+    def flush(self):
+        if self._flush_now:
+            super().flush()
 
 
 def set_verbose(enabled: bool):
@@ -17,8 +52,12 @@ def set_verbose(enabled: bool):
 
 
 def _emit(level: str, message: str):
-    prefix = datetime.utcnow().strftime("%H:%M:%S")
-    print(f"[{prefix}] {level}: {message}")
+    global _last_stamp_second, _last_stamp
+    now = int(time.time())
+    if now != _last_stamp_second:
+        _last_stamp = time.strftime("%H:%M:%S", time.gmtime(now))
+        _last_stamp_second = now
+    sys.stdout.write(f"[{_last_stamp}] {level}: {message}\n")
 
 
 def log_info(message: str):
@@ -42,6 +81,10 @@ def get_logger(run_name: str):
     """
     File + console logger for integration compatibility.
     """
+    cached = _LOGGERS.get(run_name)
+    if cached is not None:
+        return cached
+
     log_dir = os.path.join(cfg.BASE_OUTPUT_DIR, run_name)
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, "run.log")
@@ -51,16 +94,51 @@ def get_logger(run_name: str):
 
     if not logger.handlers:
         formatter = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s")
-        fh = logging.FileHandler(log_file)
+        fh = _BufferedFileHandler(log_file)
         ch = logging.StreamHandler()
         fh.setFormatter(formatter)
         ch.setFormatter(formatter)
-        logger.addHandler(fh)
-        logger.addHandler(ch)
-
+        # File and console writes happen on the listener thread; callers only enqueue.
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+        listener.start()
+        _LISTENERS[run_name] = listener
+        logger.addHandler(QueueHandler(log_queue))
+
+    _LOGGERS[run_name] = logger
     return logger
 
 
+def _stop_listener(listener: QueueListener):
+    # stop() drains the queue first, so every queued record is written.
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def close_logger(run_name: str):
+    """
+    Stop a run's log thread and flush and close its run.log.
+    Call when the run ends; a later get_logger(run_name) starts afresh.
+    """
+    logger = _LOGGERS.pop(run_name, None)
+    listener = _LISTENERS.pop(run_name, None)
+    if listener is not None:
+        _stop_listener(listener)
+    if logger is not None:
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+
+
+def _stop_listeners():
+    while _LISTENERS:
+        _stop_listener(_LISTENERS.popitem()[1])
+
+
+atexit.register(_stop_listeners)
+
+
 def log_event(event_type: str, data: dict = None):
     if data is None:
         data = {}
@@ -5,13 +5,29 @@ NetLoader-X report orchestrator.
 import csv
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 import core.config as cfg
 from utils import html_report, logger
 
+# Large text buffer so the csv module's many small per-field writes coalesce.
+CSV_WRITE_BUFFER = 1 << 20
+# metrics.json is written compact unless this is set to "1".
+ENV_JSON_PRETTY = "NETLOADER_X_JSON_PRETTY"
+# Characters in run names that would break the report folder name.
+_SAFE_NAME_TABLE = str.maketrans({" ": "_", "/": "-"})
+FOLDER_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
 
 def _output_root() -> str:
     """
@@ -29,17 +45,40 @@ class Reporter:
     """
 
     def __init__(self, attack_name: str):
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        safe_name = attack_name.replace(" ", "_").replace("/", "-")
+        # One clock read shared by the folder name (local time) and the HTML report (UTC).
+        self.created_at = datetime.now(timezone.utc)
+        timestamp = self.created_at.astimezone().strftime(FOLDER_TIMESTAMP_FORMAT)
+        safe_name = attack_name.translate(_SAFE_NAME_TABLE)
         self.attack_name = safe_name
         self.folder = os.path.join(_output_root(), f"{safe_name}_{timestamp}")
-        os.makedirs(self.folder, exist_ok=True)
+        # The timestamped folder is normally new and its parent exists: one mkdir.
+        try:
+            os.mkdir(self.folder)
+        except FileNotFoundError:
+            os.makedirs(self.folder, exist_ok=True)
+        except FileExistsError:
+            pass
         logger.log_info(f"Created report folder: {self.folder}")
 
     def export_json(self, data: Dict[str, Any]):
         path = os.path.join(self.folder, "metrics.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        pretty = os.environ.get(ENV_JSON_PRETTY) == "1"
+        encoded = None
+        if HAS_ORJSON:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            try:
+                encoded = orjson.dumps(data, option=option)
+            except TypeError:
+                encoded = None
+        if encoded is not None:
+            Path(path).write_bytes(encoded)
+        else:
+            # Encode in one go: json.dump() issues a write() per encoder chunk.
+            if pretty:
+                text = json.dumps(data, indent=2)
+            else:
+                text = json.dumps(data, separators=(",", ":"))
+            Path(path).write_text(text, encoding="utf-8")
         logger.log_info(f"JSON report saved: {path}")
 
     def export_csv(self, data: Dict[str, Any]):
@@ -50,16 +89,22 @@ class Reporter:
 
         headers = sorted({k for row in raw for k in row.keys()})
         path = os.path.join(self.folder, "metrics.csv")
-        with open(path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            for row in raw:
-                writer.writerow({key: row.get(key, "") for key in headers})
+        with open(path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(headers)
+            width = len(headers)
+            if width > 1 and all(len(row) == width for row in raw):
+                # Every tick carries every column: extract values with a C-level getter.
+                writer.writerows(map(itemgetter(*headers), raw))
+            else:
+                writer.writerows(tuple(row.get(key, "") for key in headers) for row in raw)
         logger.log_info(f"CSV report saved: {path}")
 
     def export_html(self, data: Dict[str, Any]):
         path = os.path.join(self.folder, "metrics.html")
-        html_report.generate_html_report(data, path, attack_name=self.attack_name)
+        html_report.generate_html_report(
+            data, path, attack_name=self.attack_name, generated_at=self.created_at
+        )
         logger.log_info(f"HTML report saved: {path}")
 
     def export_text_summary(self, data: Dict[str, Any]):
@@ -67,13 +112,26 @@ class Reporter:
         meta = data.get("meta", {})
         raw = data.get("raw", [])
 
-        peak_rps = max((row.get("requests_per_second", 0) for row in raw), default=0)
-        peak_latency = max((row.get("latency_ms", 0) for row in raw), default=0)
-        peak_error = max((row.get("error_rate", 0) for row in raw), default=0)
-        degraded_ticks = sum(1 for row in raw if row.get("degraded"))
-        crashed_ticks = sum(1 for row in raw if row.get("crashed"))
+        # Single pass for all peaks and state counts.
+        peak_rps = peak_latency = peak_error = 0
+        degraded_ticks = crashed_ticks = 0
+        for row in raw:
+            get = row.get
+            value = get("requests_per_second", 0)
+            if value > peak_rps:
+                peak_rps = value
+            value = get("latency_ms", 0)
+            if value > peak_latency:
+                peak_latency = value
+            value = get("error_rate", 0)
+            if value > peak_error:
+                peak_error = value
+            if get("degraded"):
+                degraded_ticks += 1
+            if get("crashed"):
+                crashed_ticks += 1
 
-        lines = [
+        lines = (
             "NetLoader-X Summary",
             "=" * 32,
             f"Run: {self.attack_name}",
@@ -91,7 +149,7 @@ class Reporter:
             "- Sustained high latency with low throughput indicates saturation.",
             "- Tune worker capacity, queue limits, and retry budgets based on these results.",
             "",
-        ]
+        )
         Path(path).write_text("\n".join(lines), encoding="utf-8")
         logger.log_info(f"Text summary saved: {path}")
 
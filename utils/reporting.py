@@ -3,23 +3,71 @@ Additional report analysis helpers.
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_ANALYSIS_CACHE: Dict[Tuple[str, int, int], Dict] = {}
+# Serial parsing runs at roughly 100+ MiB/s; a spawn-started pool re-imports
+# the app in every worker, so only very large batches win it back.
+PARALLEL_ANALYSIS_MIN_BYTES = 256 * 1024 * 1024
 
 
 def find_metric_files(root: Path) -> List[Path]:
-    return sorted(root.rglob("metrics.json"))
+    # Iterative scandir walk: DirEntry type checks reuse the directory read
+    # instead of a stat() per entry through Path.rglob.
+    found = []
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name == "metrics.json":
+                    found.append(Path(entry.path))
+    found.sort()
+    return found
 
 
 def _safe_num(value, default=0.0) -> float:
+    # Exact type checks cover the plain int/float ticks; bool is its own type,
+    # so it takes the default like None does.
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is int:
+        return float(value)
+    if value is None or kind is bool:
+        return float(default)
     try:
-        if value is None or isinstance(value, bool):
-            return float(default)
         return float(value)
     except (TypeError, ValueError):
         return float(default)
 
 
+def _read_json(path: Path):
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(path.read_bytes())
+        except ValueError:
+            # orjson rejects NaN/Infinity literals that json.dump can emit.
+            pass
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def resolve_metrics_file(path_input: str) -> Optional[Path]:
     """
     Resolve a file/directory input to a specific metrics.json file.
@@ -46,24 +94,35 @@ def load_metrics_payload(path_input: str) -> Optional[Dict]:
     metrics_file = resolve_metrics_file(path_input)
     if metrics_file is None:
         return None
-    return json.loads(metrics_file.read_text(encoding="utf-8"))
+    return _read_json(metrics_file)
 
 
 def summarize_payload(payload: Dict, file_label: str = "<memory>") -> Dict:
     raw = payload.get("raw", [])
 
     if raw and "cluster_requests_total" in raw[-1]:
-        cluster_requests = [_safe_num(row.get("cluster_requests_total", 0), 0.0) for row in raw]
-        cluster_errors = [_safe_num(row.get("cluster_errors", 0), 0.0) for row in raw]
-        cache_hit_rate = [_safe_num(row.get("db_cache_hit_rate", 0), 0.0) for row in raw]
+        # Queue columns are discovered once (key union runs in C) instead of
+        # calling endswith on every key of every tick.
+        queue_keys = tuple(sorted(key for key in set().union(*raw) if key.endswith("_queue_depth")))
 
-        total_queue_points = []
+        # Peaks, cache-hit total and per-tick queue totals in one walk.
+        peak_requests = peak_errors = peak_queue = 0.0
+        cache_hit_sum = 0.0
         for row in raw:
+            get = row.get
+            value = _safe_num(get("cluster_requests_total", 0))
+            if value > peak_requests:
+                peak_requests = value
+            value = _safe_num(get("cluster_errors", 0))
+            if value > peak_errors:
+                peak_errors = value
+            cache_hit_sum += _safe_num(get("db_cache_hit_rate", 0))
+
             q_sum = 0.0
-            for key, value in row.items():
-                if key.endswith("_queue_depth"):
-                    q_sum += _safe_num(value, 0.0)
-            total_queue_points.append(q_sum)
+            for key in queue_keys:
+                q_sum += _safe_num(get(key, 0))
+            if q_sum > peak_queue:
+                peak_queue = q_sum
 
         last = raw[-1] if raw else {}
         total_requests = _safe_num(last.get("cluster_requests_total", 0), 0.0)
@@ -75,27 +134,33 @@ def summarize_payload(payload: Dict, file_label: str = "<memory>") -> Dict:
             "mode": "cluster",
             "ticks": len(raw),
             "duration": payload.get("meta", {}).get("duration", 0),
-            "peak_rps": round(max(cluster_requests, default=0.0), 2),
+            "peak_rps": round(peak_requests, 2),
             "peak_latency_ms": 0.0,
-            "peak_queue_depth": int(max(total_queue_points, default=0.0)),
+            "peak_queue_depth": int(peak_queue),
             "avg_error_rate": round(error_ratio, 4),
-            "peak_cluster_requests": round(max(cluster_requests, default=0.0), 2),
-            "peak_cluster_errors": int(max(cluster_errors, default=0.0)),
-            "avg_cache_hit_rate": round(
-                (sum(cache_hit_rate) / len(cache_hit_rate)) if cache_hit_rate else 0.0,
-                2,
-            ),
+            "peak_cluster_requests": round(peak_requests, 2),
+            "peak_cluster_errors": int(peak_errors),
+            "avg_cache_hit_rate": round(cache_hit_sum / len(raw), 2),
             "lb_failed_requests": int(_safe_num(last.get("lb_failed_requests", 0), 0.0)),
         }
 
-    peak_rps = max((row.get("requests_per_second", 0) for row in raw), default=0)
-    peak_latency = max((row.get("latency_ms", 0) for row in raw), default=0)
-    peak_queue = max((row.get("queue_depth", 0) for row in raw), default=0)
-    avg_error = (
-        sum((row.get("error_rate", 0) for row in raw)) / len(raw)
-        if raw
-        else 0
-    )
+    # One walk over the ticks for every peak and the error total. Values are
+    # coerced: metrics.json written through orjson stores NaN/Infinity as null.
+    peak_rps = peak_latency = peak_queue = 0
+    error_sum = 0
+    for row in raw:
+        get = row.get
+        value = _safe_num(get("requests_per_second", 0))
+        if value > peak_rps:
+            peak_rps = value
+        value = _safe_num(get("latency_ms", 0))
+        if value > peak_latency:
+            peak_latency = value
+        value = _safe_num(get("queue_depth", 0))
+        if value > peak_queue:
+            peak_queue = value
+        error_sum += _safe_num(get("error_rate", 0))
+    avg_error = error_sum / len(raw) if raw else 0
 
     return {
         "file": str(file_label),
@@ -109,16 +174,75 @@ def summarize_payload(payload: Dict, file_label: str = "<memory>") -> Dict:
     }
 
 
+def _analysis_key(path: Path) -> Tuple[str, int, int]:
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _summarize_file(path: Path) -> Dict:
+    return summarize_payload(_read_json(path), file_label=str(path))
+
+
 def analyze_metrics_file(path: Path) -> Dict:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    return summarize_payload(payload, file_label=str(path))
+    # Unchanged files (same path, mtime and size) reuse the earlier summary.
+    key = _analysis_key(path)
+    cached = _ANALYSIS_CACHE.get(key)
+    if cached is None:
+        cached = _summarize_file(path)
+        _ANALYSIS_CACHE[key] = cached
+    return dict(cached)
+
+
+def load_and_summarize(path: Path) -> Tuple[Dict, Dict]:
+    """
+    Parse a metrics file once and return both the payload and its summary,
+    for callers (debrief, compare) that need the raw ticks as well.
+    Returns ``({}, {})`` when the file does not hold a metrics object.
+    """
+    key = _analysis_key(path)
+    payload = _read_json(path)
+    if not isinstance(payload, dict):
+        return {}, {}
+    summary = summarize_payload(payload, file_label=str(path))
+    _ANALYSIS_CACHE[key] = summary
+    return payload, dict(summary)
+
+
+def clear_analysis_cache() -> None:
+    _ANALYSIS_CACHE.clear()
 
 
 def analyze_directory(input_dir: str) -> List[Dict]:
     root = Path(input_dir)
     if not root.exists():
         return []
-    return [analyze_metrics_file(path) for path in find_metric_files(root)]
+
+    files = find_metric_files(root)
+    keys = [_analysis_key(path) for path in files]
+    misses = [(path, key) for path, key in zip(files, keys) if key not in _ANALYSIS_CACHE]
+
+    # Only a multi-core host with a very large batch of unseen files is worth
+    # the pool start-up cost; everything else is parsed serially below.
+    cpu = os.cpu_count() or 1
+    if cpu > 1 and len(misses) > 1 and sum(key[2] for _, key in misses) >= PARALLEL_ANALYSIS_MIN_BYTES:
+        workers = min(cpu, len(misses))
+        chunksize = max(1, len(misses) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                summaries = list(pool.map(_summarize_file, [path for path, _ in misses], chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            summaries = []
+        for (_, key), summary in zip(misses, summaries):
+            _ANALYSIS_CACHE[key] = summary
+
+    results = []
+    for path, key in zip(files, keys):
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is None:
+            cached = _summarize_file(path)
+            _ANALYSIS_CACHE[key] = cached
+        results.append(dict(cached))
+    return results
 
 
 def build_debrief(payload: Dict, summary: Dict, label: str = "") -> Dict:
@@ -137,10 +261,11 @@ def build_debrief(payload: Dict, summary: Dict, label: str = "") -> Dict:
         recovery_tick = None
 
         for row in raw:
-            tick = int(_safe_num(row.get("tick", 0), 0))
-            queue = _safe_num(row.get("queue_depth", 0), 0)
-            error = _safe_num(row.get("error_rate", 0), 0)
-            crashed = bool(row.get("crashed", False))
+            get = row.get
+            tick = int(_safe_num(get("tick", 0)))
+            queue = _safe_num(get("queue_depth", 0))
+            error = _safe_num(get("error_rate", 0))
+            crashed = bool(get("crashed", False))
 
             if high_queue_tick is None:
                 if queue_limit > 0:
@@ -155,6 +280,11 @@ def build_debrief(payload: Dict, summary: Dict, label: str = "") -> Dict:
             if crash_tick is not None and recovery_tick is None and not crashed and error < 0.08 and tick > crash_tick:
                 recovery_tick = tick
 
+            # Every marker is a first occurrence; once all are known (recovery
+            # implies a crash) the rest of the run cannot change them.
+            if recovery_tick is not None and high_queue_tick is not None and high_error_tick is not None:
+                break
+
         if high_queue_tick is not None:
             timeline.append(f"Queue pressure crossed warning threshold at tick {high_queue_tick}.")
         if high_error_tick is not None:
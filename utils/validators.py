@@ -3,6 +3,7 @@ Strict validation layer.
 """
 
 import socket
+from functools import lru_cache
 
 from core.config import GlobalConfig
 
@@ -17,7 +18,9 @@ def validate_target(host: str, port: int):
         raise ValueError("Target port out of safe range")
 
 
+@lru_cache(maxsize=1)
 def resolve_localhost():
+    # The hosts-file answer does not change for the life of the process.
     return socket.gethostbyname("localhost")
 
 
@@ -28,7 +31,7 @@ def validate_numeric_choice(choice: str, num_options: int) -> int:
     try:
         num = int(choice)
     except (TypeError, ValueError):
-        raise ValueError("Invalid input. Please enter a number.")
+        raise ValueError("Invalid input. Please enter a number.") from None
 
     if 1 <= num <= num_options:
         return num